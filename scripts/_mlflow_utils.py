@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Shared MLflow tracking setup for the scripts/ entry points"""
+import functools
+import os
+from pathlib import Path
+
+import mlflow
+from mlflow.tracking import MlflowClient
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# as_uri() handles spaces/escaping correctly and works on Windows too,
+# unlike manual "file://" + path string concatenation
+TRACKING_URI = Path(PROJECT_ROOT, "mlruns").as_uri()
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> MlflowClient:
+    """
+    Configure the tracking URI once per process and return a shared client.
+
+    Respects an explicit MLFLOW_TRACKING_URI environment variable;
+    otherwise points MLflow at the project-local mlruns directory. The
+    lru_cache means repeated calls (e.g. from a pipeline orchestrator
+    importing several scripts) reuse the same client instance.
+    """
+    env_uri = os.environ.get("MLFLOW_TRACKING_URI")
+    if env_uri:
+        mlflow.set_tracking_uri(env_uri)
+        return MlflowClient(tracking_uri=env_uri)
+
+    mlflow.set_tracking_uri(TRACKING_URI)
+    return MlflowClient(tracking_uri=TRACKING_URI)
@@ -1,17 +1,13 @@
 #!/usr/bin/env python3
 """Get the latest MLflow run ID from an experiment"""
-import os
 import sys
 import argparse
-import mlflow
-from mlflow.tracking import MlflowClient
+
+from _mlflow_utils import get_client
 
 def get_latest_run_id(experiment_name: str = "Telco Churn"):
     """Get the latest run ID from an MLflow experiment"""
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    mlruns_path = f"file://{project_root}/mlruns"
-    mlflow.set_tracking_uri(mlruns_path)
-    client = MlflowClient(tracking_uri=mlruns_path)
+    client = get_client()
     
     try:
         experiment = client.get_experiment_by_name(experiment_name)
@@ -19,9 +15,12 @@ def get_latest_run_id(experiment_name: str = "Telco Churn"):
             print(f"❌ Experiment '{experiment_name}' not found", file=sys.stderr)
             sys.exit(1)
         
+        # Filter to finished runs so the store can prune failed/running
+        # ones before sorting; max_results=1 keeps the result bounded
         runs = client.search_runs(
             experiment_ids=[experiment.experiment_id],
-            order_by=["start_time DESC"],
+            filter_string="attributes.status = 'FINISHED'",
+            order_by=["attributes.start_time DESC"],
             max_results=1
         )
         
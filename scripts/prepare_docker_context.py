@@ -1,33 +1,47 @@
 import argparse
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import mlflow
 import shutil
 import os
 import sys
-from mlflow.tracking import MlflowClient
+from _mlflow_utils import get_client
 
 # Set up basic logging
 print("Preparing Docker build context...")
 
+# Sidecar file recording what the output directory currently contains
+MANIFEST_FILE = ".manifest"
+
+
+def list_artifact_files(client, run_id):
+    """Flat, sorted (path, size) listing of every file artifact in a run"""
+    entries = []
+    stack = [""]
+    while stack:
+        prefix = stack.pop()
+        for item in client.list_artifacts(run_id, prefix):
+            if item.is_dir:
+                stack.append(item.path)
+            else:
+                entries.append((item.path, item.file_size or 0))
+    return sorted(entries)
+
+
+def manifest_digest(run_id, files):
+    """Stable hash of run id + artifact listing for change detection"""
+    return hashlib.sha256(repr((run_id, files)).encode("utf-8")).hexdigest()
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--experiment", required=True, help="Experiment Name")
     parser.add_argument("--output", required=True, help="Output directory for artifacts")
     args = parser.parse_args()
 
-    # Set MLflow tracking URI to local mlruns if not set
-    if not os.environ.get("MLFLOW_TRACKING_URI"):
-            # Assuming script is run from project root or we find mlruns relative to script?
-            # Better to expect it to be run from project root (Makefile does this)
-            cwd = os.getcwd()
-            mlruns_path = os.path.join(cwd, "mlruns")
-            if os.path.exists(mlruns_path):
-                uri = "file://" + mlruns_path
-                mlflow.set_tracking_uri(uri)
-                print(f"Tracking URI set to: {uri}")
-            else:
-                print("Warning: mlruns directory not found in current path.")
-
-    client = MlflowClient()
+    # Shared, memoized tracking setup (honors MLFLOW_TRACKING_URI,
+    # otherwise points at the project-local mlruns directory)
+    client = get_client()
+    print(f"Tracking URI set to: {mlflow.get_tracking_uri()}")
     
     # 1. Get Experiment
     print(f"Searching for experiment: {args.experiment}")
@@ -38,9 +52,11 @@ def main():
         
     # 2. Get Latest Run
     print(f"Experiment ID: {exp.experiment_id}")
+    # Only finished runs are candidates for a Docker build context
     runs = client.search_runs(
         experiment_ids=[exp.experiment_id],
-        order_by=["attribute.start_time DESC"],
+        filter_string="attributes.status = 'FINISHED'",
+        order_by=["attributes.start_time DESC"],
         max_results=1
     )
     
@@ -52,17 +68,37 @@ def main():
     run_id = run.info.run_id
     print(f"Latest Run ID: {run_id} (Status: {run.info.status})")
     
-    # 3. Download Artifacts using MLflow API (Reliable)
+    # 3. Skip the download entirely when the context is already current.
+    # The manifest hashes the run id plus the artifact listing, so an
+    # unchanged run re-uses the existing (often hundreds of MB) context.
     target_dir = args.output
+    manifest_path = os.path.join(target_dir, MANIFEST_FILE)
+    artifact_files = list_artifact_files(client, run_id)
+    digest = manifest_digest(run_id, artifact_files)
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            if f.read().strip() == digest:
+                print(f"✅ Context already up to date for run {run_id} - skipping download.")
+                return
+
+    # 4. Download Artifacts using MLflow API (Reliable)
     if os.path.exists(target_dir):
         print(f"Cleaning existing target directory: {target_dir}")
         shutil.rmtree(target_dir)
     os.makedirs(target_dir, exist_ok=True)
-        
+
     print(f"Downloading all artifacts to: {target_dir}")
     try:
-        # download_artifacts handles the source logic (file, s3, etc)
-        client.download_artifacts(run_id, "", target_dir)
+        # download_artifacts handles the source logic (file, s3, etc).
+        # Each file is an independent fetch, so overlap them with a small
+        # thread pool instead of downloading serially.
+        if artifact_files:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(
+                    lambda path: client.download_artifacts(run_id, path, target_dir),
+                    [path for path, _ in artifact_files]
+                ))
         print("✅ Success: Run artifacts downloaded.")
         
         # Verify if 'model' folder exists
@@ -82,7 +118,11 @@ def main():
                 print("⚠️  Warning: Inference might fail if not checked.")
         else:
             print("✅ 'model' artifacts present.")
-            
+
+        # Record what we downloaded so the next run can skip unchanged contexts
+        with open(manifest_path, "w") as f:
+            f.write(digest)
+
     except Exception as e:
         print(f"Error downloading artifacts: {e}")
         sys.exit(1)
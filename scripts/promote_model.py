@@ -1,17 +1,13 @@
 #!/usr/bin/env python3
 """Promote a model version to Production in MLflow Model Registry"""
-import os
 import sys
 import argparse
 import mlflow
-from mlflow.tracking import MlflowClient
+from _mlflow_utils import get_client
 
 def promote_model_to_production(run_id: str, experiment_name: str = "Telco Churn", model_name: str = "telco-churn-model"):
     """Promote a model version to Production stage in MLflow Model Registry"""
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    mlruns_path = f"file://{project_root}/mlruns"
-    mlflow.set_tracking_uri(mlruns_path)
-    client = MlflowClient(tracking_uri=mlruns_path)
+    client = get_client()
     
     try:
         run = client.get_run(run_id)
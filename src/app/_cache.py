@@ -0,0 +1,51 @@
+"""
+PREDICTION RESULT CACHE - Shared between the API endpoint and the Gradio UI
+===========================================================================
+
+Demo and load-test traffic frequently replays identical payloads; a small
+bounded TTL cache returns those without re-running the transform + model.
+The 5-minute TTL also bounds staleness across model redeploys.
+
+Lives in its own module so src/app/main.py (API) and src/app/ui.py
+(Gradio handler) can share one cache without importing each other.
+"""
+
+from threading import Lock
+
+from cachetools import TTLCache
+
+_pred_cache = TTLCache(maxsize=4096, ttl=300)
+_cache_lock = Lock()
+
+
+# Fields one caller sends and the other doesn't, with the value the model
+# effectively assumes when absent. The API schema has no SeniorCitizen;
+# the encoder leaves its column zero, which is exactly what the UI sends
+# for a non-senior customer - so defaulting it here lets the same customer
+# hit the cache from either path.
+_KEY_DEFAULTS = {"SeniorCitizen": 0}
+
+
+def cache_key(payload: dict) -> tuple:
+    """Hashable cache key from a raw customer payload.
+
+    Both the API endpoint and the Gradio handler must build their keys
+    through this function: sorting plus the absent-field defaults give
+    the two callers one canonical key per customer.
+    """
+    return tuple(sorted({**_KEY_DEFAULTS, **payload}.items()))
+
+
+def cache_get(key: tuple):
+    with _cache_lock:
+        return _pred_cache.get(key)
+
+
+def cache_put(key: tuple, result: dict):
+    with _cache_lock:
+        _pred_cache[key] = result
+
+
+def cache_clear():
+    with _cache_lock:
+        _pred_cache.clear()
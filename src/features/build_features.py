@@ -38,14 +38,19 @@ def _map_binary_series(s: pd.Series) -> pd.Series:
     return s
 
 
-def build_features(df: pd.DataFrame, target_col: str = "Churn") -> pd.DataFrame:
+def build_features(df: pd.DataFrame, target_col: str = "Churn", return_schema: bool = False):
     """
     Apply complete feature engineering pipeline for training data.
-    
+
     This is the main feature engineering function that transforms raw customer data
     into ML-ready features. The transformations must be exactly replicated in the
     serving pipeline to ensure prediction accuracy.
 
+    When return_schema=True, also returns a dict describing the column
+    groups this function produced ("numeric_cols", "binary_cols",
+    "one_hot_cols", "bool_cols"), so callers can act on them directly
+    instead of re-walking dtypes with select_dtypes.
+
     """
     df = df.copy()
     print(f"🔧 Starting feature engineering on {df.shape[1]} columns...")
@@ -85,13 +90,19 @@ def build_features(df: pd.DataFrame, target_col: str = "Churn") -> pd.DataFrame:
 
     # === STEP 5: One-Hot Encoding for Multi-Category Features ===
     # CRITICAL: drop_first=True prevents multicollinearity
+    one_hot_cols = []
     if multi_cols:
         print(f"   🌟 Applying one-hot encoding to {len(multi_cols)} multi-category columns...")
         original_shape = df.shape
-        
+        pre_dummy_cols = set(df.columns)
+
         # Apply one-hot encoding with drop_first=True (same as serving)
         df = pd.get_dummies(df, columns=multi_cols, drop_first=True)
-        
+
+        # The freshly created dummy columns are the bool columns downstream
+        # callers need to cast - record them so they don't have to re-scan
+        one_hot_cols = [c for c in df.columns if c not in pre_dummy_cols]
+
         new_features = df.shape[1] - original_shape[1] + len(multi_cols)
         print(f"      ✅ Created {new_features} new features from {len(multi_cols)} categorical columns")
 
@@ -103,5 +114,17 @@ def build_features(df: pd.DataFrame, target_col: str = "Churn") -> pd.DataFrame:
             df[c] = df[c].fillna(0).astype(int)
 
     print(f"✅ Feature engineering complete: {df.shape[1]} final features")
+
+    if return_schema:
+        feature_schema = {
+            "numeric_cols": numeric_cols,
+            "binary_cols": binary_cols,
+            "one_hot_cols": one_hot_cols,
+            # get_dummies emits bool dtype, so the dummies are exactly
+            # the columns still needing an int cast
+            "bool_cols": one_hot_cols,
+        }
+        return df, feature_schema
+
     return df
 
@@ -5,17 +5,23 @@ import pytest
 from fastapi.testclient import TestClient
 from src.app.main import app
 
-client = TestClient(app)
 
+@pytest.fixture(scope="module")
+def client():
+    # Context-manager form runs the lifespan (model preload, batching
+    # worker startup) the way a real server boot does
+    with TestClient(app) as c:
+        yield c
 
-def test_health_check():
+
+def test_health_check(client):
     """Test health check endpoint"""
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
 
-def test_predict_endpoint():
+def test_predict_endpoint(client):
     """Test prediction endpoint with valid data"""
     sample_data = {
         "gender": "Male",
@@ -39,10 +45,11 @@ def test_predict_endpoint():
     }
     response = client.post("/predict", json=sample_data)
     assert response.status_code == 200
-    assert "prediction" in response.json() or "error" in response.json()
+    # Failures surface as real HTTP errors now, never 200 {"error": ...}
+    assert "prediction" in response.json()
 
 
-def test_predict_endpoint_invalid_data():
+def test_predict_endpoint_invalid_data(client):
     """Test prediction endpoint with invalid data"""
     invalid_data = {"invalid": "data"}
     response = client.post("/predict", json=invalid_data)
@@ -0,0 +1,124 @@
+"""
+Train/serve parity tests for the feature transform
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.serving.inference as inference
+from src.features.build_features import build_features
+
+# Frozen training schema shipped with the Docker model context; the same
+# file load_model() reads in production
+SCHEMA_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "docker_model_context", "feature_columns.txt"
+)
+
+# Four customers that together cover both values of every binary column and
+# every category of every multi-category column, so training's get_dummies
+# sees the full vocabulary and drops the same references the schema froze
+ROWS = [
+    {
+        "gender": "Female", "SeniorCitizen": 0, "Partner": "Yes", "Dependents": "No",
+        "tenure": 1, "PhoneService": "Yes", "MultipleLines": "No",
+        "InternetService": "DSL", "OnlineSecurity": "Yes", "OnlineBackup": "No",
+        "DeviceProtection": "No", "TechSupport": "Yes", "StreamingTV": "No",
+        "StreamingMovies": "No", "Contract": "Month-to-month",
+        "PaperlessBilling": "Yes", "PaymentMethod": "Electronic check",
+        "MonthlyCharges": 29.85, "TotalCharges": 29.85,
+    },
+    {
+        "gender": "Male", "SeniorCitizen": 1, "Partner": "No", "Dependents": "Yes",
+        "tenure": 34, "PhoneService": "Yes", "MultipleLines": "Yes",
+        "InternetService": "Fiber optic", "OnlineSecurity": "No", "OnlineBackup": "Yes",
+        "DeviceProtection": "Yes", "TechSupport": "No", "StreamingTV": "Yes",
+        "StreamingMovies": "Yes", "Contract": "One year",
+        "PaperlessBilling": "No", "PaymentMethod": "Mailed check",
+        "MonthlyCharges": 56.95, "TotalCharges": 1889.5,
+    },
+    {
+        "gender": "Male", "SeniorCitizen": 0, "Partner": "No", "Dependents": "No",
+        "tenure": 0, "PhoneService": "No", "MultipleLines": "No phone service",
+        "InternetService": "No", "OnlineSecurity": "No internet service",
+        "OnlineBackup": "No internet service", "DeviceProtection": "No internet service",
+        "TechSupport": "No internet service", "StreamingTV": "No internet service",
+        "StreamingMovies": "No internet service", "Contract": "Two year",
+        "PaperlessBilling": "Yes", "PaymentMethod": "Bank transfer (automatic)",
+        "MonthlyCharges": 20.05, "TotalCharges": 0.0,
+    },
+    {
+        "gender": "Female", "SeniorCitizen": 1, "Partner": "Yes", "Dependents": "Yes",
+        "tenure": 72, "PhoneService": "Yes", "MultipleLines": "Yes",
+        "InternetService": "DSL", "OnlineSecurity": "Yes", "OnlineBackup": "Yes",
+        "DeviceProtection": "No", "TechSupport": "Yes", "StreamingTV": "No",
+        "StreamingMovies": "Yes", "Contract": "Month-to-month",
+        "PaperlessBilling": "No", "PaymentMethod": "Credit card (automatic)",
+        "MonthlyCharges": 89.10, "TotalCharges": 6415.2,
+    },
+]
+
+# A whitespace-padded categorical is an unknown category (all-zero block)
+# on every serving path - training's get_dummies never stripped values, so
+# neither encoder may quietly normalize and accept it
+PADDED_ROWS = ROWS + [{**ROWS[0], "InternetService": " Fiber optic "}]
+
+
+@pytest.fixture()
+def frozen_schema(monkeypatch):
+    """Run the encoders against the shipped schema, with model loading off."""
+    with open(SCHEMA_FILE) as f:
+        cols = [ln.strip() for ln in f if ln.strip()]
+    monkeypatch.setenv("MLFLOW_SKIP_LOAD", "1")
+    monkeypatch.setattr(inference, "FEATURE_COLS", cols)
+    # Reset the lazy lookup tables so they rebuild from the test schema
+    monkeypatch.setattr(inference, "FEATURE_INDEX", None)
+    monkeypatch.setattr(inference, "ONE_HOT_INDEX", None)
+    monkeypatch.setattr(inference, "ONE_HOT_BY_COL", None)
+    monkeypatch.setattr(inference, "FIELD_ROUTES", None)
+    return cols
+
+
+def test_row_encoder_matches_batch_encoder(frozen_schema):
+    """The scalar and preallocated-batch encoders must agree row for row."""
+    batch = inference._encode_batch(PADDED_ROWS)
+    for i, row in enumerate(PADDED_ROWS):
+        np.testing.assert_array_equal(inference._encode_row(row), batch[i])
+
+
+def test_serve_transform_matches_direct_encoder(frozen_schema):
+    """The pandas batch transform must produce the direct encoders' matrix."""
+    df_enc = inference._serve_transform(pd.DataFrame(PADDED_ROWS))
+    assert list(df_enc.columns) == frozen_schema
+    np.testing.assert_array_equal(
+        df_enc.to_numpy(dtype=np.float32), inference._encode_batch(PADDED_ROWS)
+    )
+
+
+def test_unknown_category_encodes_all_zero(frozen_schema):
+    """A padded/unseen categorical leaves its one-hot block all-zero."""
+    vec = inference._encode_row(PADDED_ROWS[-1])
+    index = inference._feature_index()
+    assert vec[index["InternetService_Fiber optic"]] == 0.0
+    assert vec[index["InternetService_No"]] == 0.0
+
+
+def test_serving_matches_training_build_features(frozen_schema):
+    """
+    CRITICAL train/serve consistency invariant: serving must encode exactly
+    what training's build_features produced for the same raw customers.
+    """
+    raw = pd.DataFrame(ROWS)
+    raw["Churn"] = ["Yes", "No", "No", "Yes"]
+
+    train_enc = build_features(raw, target_col="Churn").drop(columns=["Churn"])
+    # Same bool->int cast the training pipeline applies after build_features
+    for c in train_enc.select_dtypes(include=["bool"]).columns:
+        train_enc[c] = train_enc[c].astype(int)
+
+    assert set(train_enc.columns) == set(frozen_schema)
+    np.testing.assert_array_equal(
+        inference._encode_batch(ROWS),
+        train_enc[frozen_schema].to_numpy(dtype=np.float32),
+    )